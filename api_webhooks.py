@@ -21,9 +21,14 @@ import os
 import json
 import hmac
 import hashlib
-import uuid
+import re
 import time
-from datetime import datetime
+import random
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Blueprint, request, jsonify
 
 from pr_security import (
@@ -65,8 +70,6 @@ def notify_discord(title, message, color=0xFF0000, fields=None):
     if not webhook_url:
         return  # No webhook configured — skip silently
 
-    import requests as req
-
     embed = {
         "title": title,
         "description": message[:2000],
@@ -77,7 +80,7 @@ def notify_discord(title, message, color=0xFF0000, fields=None):
         embed["fields"] = [{"name": k, "value": str(v)[:1024], "inline": True} for k, v in fields.items()]
 
     try:
-        req.post(webhook_url, json={"embeds": [embed]}, timeout=5)
+        requests.post(webhook_url, json={"embeds": [embed]}, timeout=5)
     except Exception as e:
         print(f"[DISCORD] Notification failed: {e}", flush=True)
 
@@ -298,18 +301,28 @@ def github_headers():
         headers["Authorization"] = f"token {GITHUB_TOKEN}"
     return headers
 
+# Shared session so GitHub calls reuse the TLS connection to api.github.com.
+# Only GETs retry on 5xx: a retried POST/PUT could double-comment or re-merge.
+_GITHUB_RETRY = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+_GITHUB_SESSION = requests.Session()
+_GITHUB_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_GITHUB_RETRY))
+_GITHUB_SESSION.headers.update(github_headers())
+
 def check_duplicate_bounty(pr_number):
     """
     Check if a PR references an already-closed, already-paid bounty issue.
     Returns: (is_duplicate, issue_number, reason) or (False, None, None)
     """
-    import re
-    import requests
-    
     try:
         # Get PR body to find linked issue
         url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}"
-        resp = requests.get(url, headers=github_headers(), timeout=10)
+        resp = _GITHUB_SESSION.get(url, timeout=10)
         if resp.status_code != 200:
             return False, None, None
         
@@ -333,7 +346,7 @@ def check_duplicate_bounty(pr_number):
         
         # Check if issue is closed
         issue_url = f"https://api.github.com/repos/{REPO}/issues/{issue_number}"
-        issue_resp = requests.get(issue_url, headers=github_headers(), timeout=10)
+        issue_resp = _GITHUB_SESSION.get(issue_url, timeout=10)
         if issue_resp.status_code != 200:
             return False, None, None
         
@@ -344,7 +357,7 @@ def check_duplicate_bounty(pr_number):
         # Issue is closed — check if there's already a merged PR for it
         # Search closed PRs referencing this issue
         search_url = f"https://api.github.com/search/issues?q=repo:{REPO}+is:pr+is:merged+{issue_number}+in:body"
-        search_resp = requests.get(search_url, headers=github_headers(), timeout=10)
+        search_resp = _GITHUB_SESSION.get(search_url, timeout=10)
         
         if search_resp.status_code == 200:
             results = search_resp.json().get("items", [])
@@ -374,12 +387,9 @@ def get_bounty_amount(issue_number):
     Fetch bounty amount from issue title.
     Returns: amount (int) or None
     """
-    import re
-    import requests
-    
     try:
         url = f"https://api.github.com/repos/{REPO}/issues/{issue_number}"
-        resp = requests.get(url, headers=github_headers(), timeout=10)
+        resp = _GITHUB_SESSION.get(url, timeout=10)
         
         if resp.status_code != 200:
             return None
@@ -398,16 +408,13 @@ def get_bounty_amount(issue_number):
 
 def post_github_comment(issue_number, comment):
     """Post a comment on a GitHub issue/PR."""
-    import requests
-    
     if not GITHUB_TOKEN:
         return False
     
     try:
         url = f"https://api.github.com/repos/{REPO}/issues/{issue_number}/comments"
-        resp = requests.post(
+        resp = _GITHUB_SESSION.post(
             url,
-            headers=github_headers(),
             json={"body": comment},
             timeout=15
         )
@@ -425,8 +432,6 @@ def trigger_ai_review(pr_number):
     Calls the review endpoint internally.
     Returns: (review_result, error)
     """
-    import requests
-    
     try:
         # Call internal review endpoint
         # Use module-level BASE_URL constant (no localhost default!)
@@ -466,13 +471,10 @@ def auto_merge_pr(pr_number, review_score):
     Auto-merge a PR. Threshold checks are handled by should_auto_merge() in the merit system.
     Returns: (success, error)
     """
-    import requests
-    
     try:
         url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}/merge"
-        resp = requests.put(
+        resp = _GITHUB_SESSION.put(
             url,
-            headers=github_headers(),
             json={
                 "commit_title": f"Auto-merge PR #{pr_number} (AI score: {review_score}/10)",
                 "commit_message": f"Automatically merged after passing AI review with score {review_score}/10",
@@ -537,7 +539,6 @@ def execute_auto_payment(pr_number, wallet, amount, bounty_issue_id=None, review
         # Look up SENDER's token account
         print(f"[PAYMENT] Looking up sender's WATT token account...", flush=True)
         try:
-            import requests
             sender_rpc_payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -688,10 +689,6 @@ def queue_payment(pr_number, wallet, amount, bounty_issue_id=None, review_score=
     Add payment to queue for processing after deployment.
     Prevents payments during deployment which causes container restarts.
     """
-    import json
-    import os
-    from datetime import datetime
-    
     queue_file = "/app/data/payment_queue.json"
     
     # Ensure data directory exists
@@ -752,17 +749,15 @@ def handle_pr_review_trigger(pr_number, action):
         post_github_comment(pr_number, comment)
         
         # Close the PR automatically
-        import requests as req
         try:
             close_url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}"
-            req.patch(close_url, headers=github_headers(), json={"state": "closed"}, timeout=10)
+            _GITHUB_SESSION.patch(close_url, json={"state": "closed"}, timeout=10)
         except:
             pass
         
         # Get author for reputation hit
         try:
-            pr_resp = req.get(f"https://api.github.com/repos/{REPO}/pulls/{pr_number}",
-                            headers=github_headers(), timeout=10)
+            pr_resp = _GITHUB_SESSION.get(f"https://api.github.com/repos/{REPO}/pulls/{pr_number}", timeout=10)
             pr_author = pr_resp.json().get("user", {}).get("login", "unknown") if pr_resp.status_code == 200 else "unknown"
         except:
             pr_author = "unknown"
@@ -809,10 +804,8 @@ def handle_pr_review_trigger(pr_number, action):
     # If review passed threshold, check merit system before merging
     if passed and score >= 7:  # Minimum possible threshold (gold tier)
         # Get PR author
-        import requests as req
         try:
-            pr_resp = req.get(f"https://api.github.com/repos/{REPO}/pulls/{pr_number}",
-                            headers=github_headers(), timeout=10)
+            pr_resp = _GITHUB_SESSION.get(f"https://api.github.com/repos/{REPO}/pulls/{pr_number}", timeout=10)
             pr_author = pr_resp.json().get("user", {}).get("login", "unknown") if pr_resp.status_code == 200 else "unknown"
         except:
             pr_author = "unknown"
@@ -927,9 +920,13 @@ def queue_payout(pr_number, wallet, amount, bounty_issue_id, review_data):
 # WEBHOOK HANDLER
 # =============================================================================
 
+# Trace IDs only need to be distinct, not unpredictable
+_getrandbits = random.getrandbits
+
+
 def generate_request_id():
     """Generate a short unique request ID for tracing webhook events."""
-    return uuid.uuid4().hex[:8]
+    return '%08x' % _getrandbits(32)
 
 
 @webhooks_bp.route('/webhooks/github', methods=['POST'])
@@ -941,7 +938,7 @@ def github_webhook():
     - pull_request (closed + merged)
     """
     request_id = generate_request_id()
-    start_time = time.time()
+    start_time = time.perf_counter()
     print(f"[WEBHOOK:{request_id}] Incoming webhook from {request.remote_addr}", flush=True)
 
     # Verify signature if secret is configured
@@ -955,7 +952,7 @@ def github_webhook():
                 "ip": request.remote_addr,
                 "headers": dict(request.headers)
             })
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             print(f"[WEBHOOK:{request_id}] Rejected invalid signature in {elapsed:.2f}s", flush=True)
             return jsonify({"error": "Invalid signature"}), 403
     
@@ -964,14 +961,14 @@ def github_webhook():
     payload = request.get_json()
     
     if not payload:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] Rejected empty payload in {elapsed:.2f}s", flush=True)
         return jsonify({"error": "No payload"}), 400
 
     # Validate payload structure for pull_request events
     if event_type == 'pull_request':
         if 'pull_request' not in payload:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             print(f"[WEBHOOK:{request_id}] Malformed payload: missing pull_request key in {elapsed:.2f}s", flush=True)
             log_security_event("webhook_malformed_payload", {
                 "request_id": request_id,
@@ -981,7 +978,7 @@ def github_webhook():
             return jsonify({"error": "Malformed payload: missing pull_request"}), 400
 
         if not payload.get("pull_request", {}).get("number"):
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             print(f"[WEBHOOK:{request_id}] Malformed payload: missing PR number in {elapsed:.2f}s", flush=True)
             log_security_event("webhook_malformed_payload", {
                 "request_id": request_id,
@@ -992,7 +989,7 @@ def github_webhook():
     
     # Only handle pull_request events
     if event_type != 'pull_request':
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] Ignoring event type: {event_type} in {elapsed:.2f}s", flush=True)
         return jsonify({"message": f"Ignoring event type: {event_type}"}), 200
     
@@ -1007,7 +1004,7 @@ def github_webhook():
     if action in ["opened", "synchronize"]:
         print(f"[WEBHOOK:{request_id}] Triggering AI review for PR #{pr_number}", flush=True)
         result = handle_pr_review_trigger(pr_number, action)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] Completed in {elapsed:.2f}s", flush=True)
         return result
     
@@ -1020,12 +1017,12 @@ def github_webhook():
             "pr_number": pr_number,
             "author": pr_author
         })
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] PR #{pr_number} rejected, recorded in {elapsed:.2f}s", flush=True)
         return jsonify({"message": f"PR #{pr_number} closed without merge — rejection recorded"}), 200
     
     if action != "closed" or not merged:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] Ignoring action={action} merged={merged} in {elapsed:.2f}s", flush=True)
         return jsonify({"message": f"Ignoring action: {action}, merged: {merged}"}), 200
     
@@ -1072,7 +1069,7 @@ Please update the PR description with your wallet address in this format:
             fields={"PR": f"#{pr_number}", "Author": pr.get("user", {}).get("login", "unknown"), "Error": str(wallet_error)[:200]}
         )
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] Wallet extraction failed for PR #{pr_number} in {elapsed:.2f}s", flush=True)
         return jsonify({"message": "Wallet not found in PR"}), 200
     
@@ -1095,7 +1092,7 @@ If you believe this is a bounty PR, please contact an admin to manually process
             "wallet": wallet
         })
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] No review found for PR #{pr_number} in {elapsed:.2f}s", flush=True)
         return jsonify({"message": "No review found"}), 200
     
@@ -1124,7 +1121,6 @@ Payout has been flagged for manual admin review.
     
     if not bounty_issue_id:
         # Try to find from PR body
-        import re
         referenced = re.findall(r'(?:closes?|fixes?|resolves?)?\s*#(\d+)', pr_body, re.IGNORECASE)
         if referenced:
             # Take the first referenced issue
@@ -1154,7 +1150,7 @@ An admin will review and process the payout manually if applicable.
             "bounty_issue_id": bounty_issue_id
         })
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         print(f"[WEBHOOK:{request_id}] No bounty amount for PR #{pr_number} in {elapsed:.2f}s", flush=True)
         return jsonify({"message": "No bounty amount found"}), 200
     
@@ -1175,7 +1171,7 @@ An admin will review and process the payout manually if applicable.
         "bounty_issue_id": bounty_issue_id
     })
     
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     print(f"[WEBHOOK:{request_id}] Payment queued for PR #{pr_number} ({amount:,} WATT) in {elapsed:.2f}s", flush=True)
 
     return jsonify({
@@ -1194,13 +1190,12 @@ def check_payment_already_sent(pr_number, recipient_wallet, amount):
     Looks at bounty wallet's recent TXs for a memo matching this PR.
     Returns tx_signature if found, None otherwise.
     """
-    import requests as req
     try:
         bounty_wallet = os.getenv("BOUNTY_WALLET_ADDRESS", "7vvNkG3JF3JpxLEavqZSkc5T3n9hHR98Uw23fbWdXVSF")
         rpc_url = "https://api.mainnet-beta.solana.com"
         
         # Get recent signatures from bounty wallet (last 10)
-        resp = req.post(rpc_url, json={
+        resp = requests.post(rpc_url, json={
             "jsonrpc": "2.0", "id": 1,
             "method": "getSignaturesForAddress",
             "params": [bounty_wallet, {"limit": 10}]
@@ -1214,7 +1209,7 @@ def check_payment_already_sent(pr_number, recipient_wallet, amount):
                 continue
             
             # Fetch full TX to check memo
-            tx_resp = req.post(rpc_url, json={
+            tx_resp = requests.post(rpc_url, json={
                 "jsonrpc": "2.0", "id": 1,
                 "method": "getTransaction",
                 "params": [sig, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}]
@@ -1280,14 +1275,23 @@ def record_completed_payout(pr_number, wallet, amount, tx_signature, bounty_issu
         print(f"[RECORD] ❌ Failed to record payout: {e}", flush=True)
 
 
+PAYMENT_RETRY_BASE_SECONDS = 30
+
+
+def _next_retry_at(retry_count):
+    """
+    Schedule the next payment retry: exponential backoff scaled by a random
+    0.5x-1.5x jitter so payments that failed together don't retry together.
+    """
+    delay = PAYMENT_RETRY_BASE_SECONDS * (2 ** (retry_count - 1)) * (0.5 + random.random())
+    return (datetime.utcnow() + timedelta(seconds=delay)).isoformat()
+
+
 def process_payment_queue():
     """
     Process pending payments from queue file.
     Called on startup after deploy. Checks on-chain before resending.
     """
-    import json
-    from datetime import datetime, timedelta
-    
     queue_file = "/app/data/payment_queue.json"
     
     if not os.path.exists(queue_file):
@@ -1439,7 +1443,7 @@ def process_payment_queue():
                     payment["status"] = "retry"
                     payment["retry_count"] = retry_count
                     payment["last_error"] = error
-                    payment["next_retry_at"] = (datetime.utcnow() + timedelta(seconds=30 * (2 ** (retry_count - 1)))).isoformat()
+                    payment["next_retry_at"] = _next_retry_at(retry_count)
                     print(f"[QUEUE] ⏳ PR #{pr_number} payment failed, retry {retry_count}/3 scheduled", flush=True)
                 else:
                     payment["status"] = "failed"
@@ -1463,7 +1467,7 @@ def process_payment_queue():
                 payment["status"] = "retry"
                 payment["retry_count"] = retry_count
                 payment["last_error"] = str(e)
-                payment["next_retry_at"] = (datetime.utcnow() + timedelta(seconds=30 * (2 ** (retry_count - 1)))).isoformat()
+                payment["next_retry_at"] = _next_retry_at(retry_count)
                 print(f"[QUEUE] ⏳ PR #{pr_number} exception, retry {retry_count}/3 scheduled", flush=True)
             else:
                 payment["status"] = "failed"
@@ -29,13 +29,15 @@ CHANGELOG v1.2.0:
 """
 
 import os
+import re
 import json
+import atexit
 import time
 import random
 import logging
 import ipaddress
 import socket
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from collections import defaultdict, deque
 
 import requests
@@ -43,6 +45,7 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 from flask import Flask, render_template_string, request, session, jsonify
 from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
 from anthropic import Anthropic
 from openai import OpenAI
 
@@ -62,8 +65,62 @@ from scraper_errors import (
     handle_too_many_redirects
 )
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Same tree-builder choice as wattnode's scraper, so the BeautifulSoup
+# fallback yields the same text on both sides
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup tree builder
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    from cachetools import TTLCache
+    HAS_CACHETOOLS = True
+except ImportError:
+    HAS_CACHETOOLS = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Keeps DefaultJSONProvider semantics (sorted keys, RFC 822 datetimes via
+    `default`) and falls back to stdlib json for anything orjson rejects.
+    Only encoding uses orjson: request bodies are small, and the stdlib parser
+    accepts NaN, lone surrogates and >64-bit ints that orjson rejects or
+    turns into floats.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        if set(kwargs) - {"indent", "separators"}:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+
 app = Flask(__name__)
 app.secret_key = os.getenv("SECRET_KEY", "wattcoin-dev-key-change-in-prod")
+if HAS_ORJSON:
+    app.json = ORJSONProvider(app)
 
 # =============================================================================
 # LOGGING
@@ -128,7 +185,7 @@ from api_nodes import nodes_bp, create_job, wait_for_job_result, cancel_job, get
 from api_pr_review import pr_review_bp
 from api_webhooks import webhooks_bp, process_payment_queue, load_reputation_data
 from api_wsi import wsi_bp
-from data_backup import backup_bp
+from data_backup import backup_bp, run_startup_backup
 app.register_blueprint(admin_bp)
 app.register_blueprint(bounties_bp)
 app.register_blueprint(llm_bp)
@@ -197,6 +254,7 @@ print("[STARTUP] Payment queue check scheduled (15s delay)", flush=True)
 
 SCRAPE_TIMEOUT_SECONDS = 30
 MAX_CONTENT_BYTES = 2 * 1024 * 1024  # 2MB
+READ_CHUNK_SIZE = 64 * 1024
 MAX_REDIRECTS = 3
 TRUST_PROXY_HEADERS = os.getenv("SCRAPE_TRUST_PROXY", "false").lower() == "true"
 RATE_LIMIT_WINDOW_SECONDS = 60 * 60  # 1 hour
@@ -205,6 +263,8 @@ MAX_REQUESTS_PER_URL = 10
 
 # API Key config
 API_KEYS_FILE = "/app/data/api_keys.json"
+API_KEY_CACHE_TTL_SECONDS = 30
+API_KEY_USAGE_FLUSH_SECONDS = 30  # how often usage counts are written back
 DATA_FILE = "/app/data/bounty_reviews.json"
 API_KEY_RATE_LIMITS = {
     "basic": {"requests_per_hour": 500, "requests_per_url": 50},
@@ -224,6 +284,20 @@ _rate_limit_url = defaultdict(deque)
 _rate_limit_api_key = defaultdict(deque)
 _rate_limit_api_key_url = defaultdict(deque)
 
+# Valid API keys -> key data, so repeat requests skip re-reading API_KEYS_FILE.
+# Entries belong to one (mtime, size) of the file: any outside write, such as
+# an admin revoke or another worker's save, empties the cache on the next check.
+_api_key_cache = TTLCache(maxsize=10_000, ttl=API_KEY_CACHE_TTL_SECONDS) if HAS_CACHETOOLS else None
+_api_key_cache_stamp = None
+_api_key_cache_lock = threading.Lock()
+
+# API key -> [requests since last flush, last_used]; written to API_KEYS_FILE
+# in batches instead of a full read+rewrite on every keyed request
+_api_key_usage = {}
+_api_key_usage_flushed = time.monotonic()
+_api_key_usage_lock = threading.Lock()
+_api_key_flush_lock = threading.Lock()
+
 # =============================================================================
 # API KEY VALIDATION
 # =============================================================================
@@ -238,30 +312,96 @@ def _load_api_keys():
 
 def _save_api_keys(data):
     """Save API keys to JSON file."""
+    global _api_key_cache_stamp
+    before = _api_keys_stamp()
     try:
         os.makedirs(os.path.dirname(API_KEYS_FILE), exist_ok=True)
         with open(API_KEYS_FILE, 'w') as f:
             json.dump(data, f, indent=2)
     except Exception as e:
         print(f"Error saving API keys: {e}")
+        return
+    if _api_key_cache is not None:
+        stamp = _api_keys_stamp()
+        keys = data.get("keys", {})
+        with _api_key_cache_lock:
+            if before != _api_key_cache_stamp:
+                # Someone else (e.g. an admin revoke) wrote the file since the
+                # cache was last checked against it; don't vouch for entries
+                _api_key_cache.clear()
+                _api_key_cache_stamp = None
+                return
+            # Only our own write changed the file: keep entries still active in it
+            for api_key in list(_api_key_cache):
+                if keys.get(api_key, {}).get("status") != "active":
+                    del _api_key_cache[api_key]
+            _api_key_cache_stamp = stamp
+
+def _api_keys_stamp():
+    """(mtime_ns, size) of API_KEYS_FILE, or None if it doesn't exist."""
+    try:
+        st = os.stat(API_KEYS_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 def _validate_api_key(api_key):
     """Validate API key and return key data if valid."""
+    global _api_key_cache_stamp
     if not api_key:
         return None
+    if _api_key_cache is not None:
+        stamp = _api_keys_stamp()
+        with _api_key_cache_lock:
+            if stamp != _api_key_cache_stamp:
+                _api_key_cache.clear()
+                _api_key_cache_stamp = stamp
+            key_data = _api_key_cache.get(api_key)
+        if key_data is not None:
+            return key_data
     data = _load_api_keys()
     key_data = data.get("keys", {}).get(api_key)
     if key_data and key_data.get("status") == "active":
+        if _api_key_cache is not None:
+            with _api_key_cache_lock:
+                _api_key_cache[api_key] = key_data
         return key_data
     return None
 
 def _increment_api_key_usage(api_key):
-    """Increment usage count for an API key."""
-    data = _load_api_keys()
-    if api_key in data.get("keys", {}):
-        data["keys"][api_key]["usage_count"] = data["keys"][api_key].get("usage_count", 0) + 1
-        data["keys"][api_key]["last_used"] = datetime.utcnow().isoformat() + "Z"
-        _save_api_keys(data)
+    """Count a request against an API key; flushed to API_KEYS_FILE in batches."""
+    last_used = datetime.utcnow().isoformat() + "Z"
+    with _api_key_usage_lock:
+        entry = _api_key_usage.get(api_key)
+        if entry is None:
+            _api_key_usage[api_key] = [1, last_used]
+        else:
+            entry[0] += 1
+            entry[1] = last_used
+        due = time.monotonic() - _api_key_usage_flushed >= API_KEY_USAGE_FLUSH_SECONDS
+    if due:
+        _flush_api_key_usage()
+
+def _flush_api_key_usage():
+    """Add pending usage counts to API_KEYS_FILE in one read+write."""
+    global _api_key_usage, _api_key_usage_flushed
+    with _api_key_flush_lock:
+        with _api_key_usage_lock:
+            pending, _api_key_usage = _api_key_usage, {}
+            _api_key_usage_flushed = time.monotonic()
+        if not pending:
+            return
+        data = _load_api_keys()
+        keys = data.get("keys", {})
+        known = [api_key for api_key in pending if api_key in keys]
+        for api_key in known:
+            count, last_used = pending[api_key]
+            keys[api_key]["usage_count"] = keys[api_key].get("usage_count", 0) + count
+            keys[api_key]["last_used"] = last_used
+        if known:
+            _save_api_keys(data)
+
+atexit.register(_flush_api_key_usage)
 
 def _check_api_key_rate_limit(api_key, url, tier):
     """Check rate limit for API key. Returns (allowed, retry_after)."""
@@ -366,7 +506,7 @@ def _resolves_to_public_ip(hostname):
 
 
 def _validate_scrape_url(target_url):
-    parsed = urlparse(target_url)
+    parsed = urlsplit(target_url)
     if parsed.scheme not in {"http", "https"}:
         return False
     if parsed.username or parsed.password:
@@ -379,13 +519,55 @@ def _validate_scrape_url(target_url):
 
 
 def _read_limited_content(resp):
+    # Returned as the bytearray itself; every caller only decodes or parses it.
     content = bytearray()
-    for chunk in resp.iter_content(chunk_size=8192):
+    remaining = MAX_CONTENT_BYTES
+    for chunk in resp.iter_content(chunk_size=READ_CHUNK_SIZE):
         if chunk:
-            content.extend(chunk)
-            if len(content) > MAX_CONTENT_BYTES:
+            if len(chunk) > remaining:
                 raise ValueError("Response too large")
-    return bytes(content)
+            content.extend(chunk)
+            remaining -= len(chunk)
+    return content
+
+
+def _html_to_text(html_text):
+    """Extract page text like BeautifulSoup's get_text(' ', strip=True), via lexbor when available."""
+    if HAS_SELECTOLAX:
+        try:
+            tree = LexborHTMLParser(html_text)
+            # get_text() leaves script/style contents out; match that
+            tree.strip_tags(['script', 'style'])
+            if tree.root is None:
+                return ''
+            # Split on NUL (never left in parsed text) so whitespace-only
+            # nodes drop out instead of leaving double spaces, as in get_text()
+            parts = tree.root.text(separator='\x00', strip=True).split('\x00')
+            return ' '.join(part for part in parts if part)
+        except Exception as e:
+            logger.warning("lexbor parse failed, falling back to BeautifulSoup | error=%s", e)
+    return BeautifulSoup(html_text, HTML_PARSER).get_text(separator=' ', strip=True)
+
+
+# 19+ digit runs may be integers outside orjson's 64-bit range, which it
+# silently turns into floats instead of rejecting
+_WIDE_NUMBER_RE = re.compile(rb'\d{19}')
+
+
+def _parse_json_body(raw_bytes, encoding):
+    """Parse a scraped JSON body, using orjson directly on UTF-8 bytes.
+
+    Payloads orjson rejects (NaN, lone surrogates) or could round (numbers
+    with 19+ digits) go through json.loads, so results match the stdlib.
+    """
+    if (HAS_ORJSON
+            and encoding.lower().replace('_', '-') in ('utf-8', 'utf8', 'ascii', 'us-ascii')
+            and not _WIDE_NUMBER_RE.search(raw_bytes)):
+        try:
+            return orjson.loads(raw_bytes)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw_bytes.decode(encoding, errors='replace'))
 
 
 def _fetch_with_redirects(url, headers):
@@ -1065,8 +1247,7 @@ def scrape():
                     content = raw_bytes.decode('utf-8', errors='replace')
             elif output_format == 'json':
                 try:
-                    text = raw_bytes.decode(encoding, errors='replace')
-                    content = json.loads(text)
+                    content = _parse_json_body(raw_bytes, encoding)
                 except json.JSONDecodeError:
                     error = content_parsing_error('json')
                     response, status = error.to_response()
@@ -1077,9 +1258,7 @@ def scrape():
                     return jsonify(response), status
             else:  # text
                 try:
-                    html_text = raw_bytes.decode(encoding, errors='replace')
-                    soup = BeautifulSoup(html_text, 'html.parser')
-                    content = soup.get_text(separator=' ', strip=True)
+                    content = _html_to_text(raw_bytes.decode(encoding, errors='replace'))
                 except Exception as e:
                     error = content_parsing_error('text', e)
                     response, status = error.to_response()
@@ -1100,7 +1279,8 @@ def scrape():
             return jsonify(response), status
         
         # === SUCCESS ===
-        content_len = len(content) if isinstance(content, str) else len(json.dumps(content))
+        # JSON content is logged by its upstream size; re-encoding it just for the log line is wasted work
+        content_len = len(content) if isinstance(content, str) else len(raw_bytes)
         logger.info("scrape success | ip=%s url=%.120s format=%s status=%d content_len=%d", client_ip, target_url, output_format, resp.status_code, content_len)
         
         response_data = {
@@ -1470,5 +1650,6 @@ def bounty_stats():
 
 
 if __name__ == '__main__':
+    run_startup_backup()  # background thread; only on real startup, not on import
     port = int(os.getenv('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -2,8 +2,8 @@
 Data Backup and Integrity Module for WattCoin.
 
 Provides:
-- SHA256 checksum generation and verification for all data files
-- Automatic backups with 7-day rotation and compression
+- BLAKE3 (SHA256 fallback) checksum generation and verification for all data files
+- Automatic backups with 7-day rotation and zstd compression (gzip fallback)
 - Restore from backup with integrity verification
 - Flask blueprint with API endpoints for backup management
 - Auto-backup on app startup
@@ -21,12 +21,39 @@ Data files protected:
 import os
 import json
 import hashlib
+import hmac
 import shutil
 import gzip
 import glob
-from datetime import datetime, timedelta
+import threading
+from collections import deque
+try:
+    import mmap
+    HAS_MMAP = True
+except ImportError:
+    HAS_MMAP = False
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from flask import Blueprint, jsonify, request
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 backup_bp = Blueprint('backup', __name__)
 
 # =============================================================================
@@ -50,44 +77,180 @@ DATA_FILES = [
 ]
 
 ADMIN_KEY = os.getenv("ADMIN_API_KEY", "")
+_ADMIN_KEY_B = ADMIN_KEY.encode()
+
+# hashlib/zlib release the GIL on large buffers, so per-file work runs in parallel
+MAX_WORKERS = min(8, len(DATA_FILES))
+READ_CHUNK_SIZE = 1024 * 1024  # fallback read size when mmap is unavailable
+ZSTD_LEVEL = 3  # ~gzip-6 ratio at several times the throughput
+GZIP_LEVEL = 1  # fallback only; level 9 (the gzip default) is several times slower
+COPY_BUFFER_SIZE = 1024 * 1024
+GZIP_CHUNK_SIZE = 4 * 1024 * 1024  # pigz-style member size for the parallel gzip fallback
+
+# New backups are written as .zst when zstandard is installed; .gz is still
+# read so backups taken before the switch remain restorable.
+BACKUP_SUFFIXES = (".zst", ".gz")
+
+# Files below this size gain nothing from compression; they are stored
+# as-is under their own name and restored with a kernel-side copy.
+COMPRESS_MIN_BYTES = 4096
+
+# Serializes create/restore so a manual POST cannot race the startup backup
+_BACKUP_LOCK = threading.Lock()
+
+# filepath -> (st_mtime_ns, st_size, CHECKSUM_ALGO hexdigest)
+_CHK_CACHE = {}
+
+# Checksums only guard against corruption/tampering of our own files, so the
+# faster BLAKE3 is used when installed. Records carry the algorithm name as
+# their digest key, and older "sha256" baselines are still verified.
+CHECKSUM_ALGO = "blake3" if HAS_BLAKE3 else "sha256"
+CHECKSUM_SCHEMA_VERSION = 2
+
+
+def _new_digest():
+    """Fresh hasher for CHECKSUM_ALGO."""
+    if HAS_BLAKE3:
+        return blake3(max_threads=blake3.AUTO)
+    return hashlib.sha256()
 
 
 # =============================================================================
 # CHECKSUM FUNCTIONS
 # =============================================================================
 
-def compute_checksum(filepath):
-    """Compute SHA256 checksum of a file."""
-    sha256 = hashlib.sha256()
+def _hash_fileobj(f, digest):
+    """Feed an open binary file into digest, mmap'ing it when possible."""
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        return
+    if HAS_MMAP:
+        try:
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+            return
+        except (ValueError, OSError):
+            pass  # fall back to buffered reads (e.g. file shrank, no mmap support)
+
+    buf = bytearray(READ_CHUNK_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        digest.update(view[:n])
+
+
+def compute_checksum(filepath, use_cache=True):
+    """
+    Compute the CHECKSUM_ALGO checksum of a file.
+    Digests are cached per (mtime_ns, size) so unchanged files are not re-read;
+    use_cache=False always hashes the file contents.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            st = os.fstat(f.fileno())
+            key = (st.st_mtime_ns, st.st_size)
+            cached = _CHK_CACHE.get(filepath)
+            if use_cache and cached and cached[:2] == key:
+                return cached[2]
+
+            h = _new_digest()
+            _hash_fileobj(f, h)
+            digest = h.hexdigest()
+    except FileNotFoundError:
+        return None
+
+    _CHK_CACHE[filepath] = (*key, digest)
+    return digest
+
+
+def _legacy_sha256(filepath):
+    """Uncached SHA256 of a file, for baselines written before BLAKE3."""
     try:
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            h = hashlib.sha256()
+            _hash_fileobj(f, h)
+            return h.hexdigest()
     except FileNotFoundError:
         return None
 
 
+def clear_checksum_cache():
+    """Drop cached digests (after files are rewritten by backup/restore)."""
+    _CHK_CACHE.clear()
+
+
+def _utc_timestamp():
+    """Current UTC time as an ISO-8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _checksum_entry(filename):
+    """
+    Compute (filename, checksum, stat) for one data file.
+    The stat is taken before hashing, so a write racing the hash leaves a
+    stale mtime behind and the next verify re-hashes instead of trusting it.
+    """
+    filepath = os.path.join(DATA_DIR, filename)
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return filename, None, None
+    checksum = compute_checksum(filepath)
+    if not checksum:
+        return filename, None, None
+    return filename, checksum, st
+
+
 def generate_checksums():
     """Generate checksums for all data files."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = list(pool.map(_checksum_entry, DATA_FILES))
+
+    now_iso = _utc_timestamp()
     checksums = {}
-    for filename in DATA_FILES:
-        filepath = os.path.join(DATA_DIR, filename)
-        checksum = compute_checksum(filepath)
+    for filename, checksum, st in results:
         if checksum:
             checksums[filename] = {
-                "sha256": checksum,
-                "size": os.path.getsize(filepath),
-                "checked_at": datetime.utcnow().isoformat() + "Z"
+                CHECKSUM_ALGO: checksum,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "checked_at": now_iso
             }
     return checksums
 
 
+def _serialize_checksums(checksums):
+    """Encode checksums as indented JSON bytes, wrapped with the schema version."""
+    doc = {"schema_version": CHECKSUM_SCHEMA_VERSION, "files": checksums}
+    if HAS_ORJSON:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2)
+    return json.dumps(doc, indent=2).encode("utf-8")
+
+
+def _atomic_write(path, data):
+    """
+    Write bytes to path via a temp file, fsync and rename.
+    Readers never observe a torn file, even if the process dies mid-write.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
 def save_checksums(checksums):
     """Save checksums to disk."""
     try:
-        with open(CHECKSUM_FILE, "w") as f:
-            json.dump(checksums, f, indent=2)
+        _atomic_write(CHECKSUM_FILE, _serialize_checksums(checksums))
         return True
     except Exception as e:
         print(f"[BACKUP] Error saving checksums: {e}", flush=True)
@@ -95,29 +258,49 @@ def save_checksums(checksums):
 
 
 def load_checksums():
-    """Load saved checksums from disk."""
+    """
+    Load saved checksums from disk as {filename: record}.
+    Accepts both the versioned format and the original flat sha256 mapping.
+    """
     try:
         if os.path.exists(CHECKSUM_FILE):
-            with open(CHECKSUM_FILE, "r") as f:
-                return json.load(f)
+            with open(CHECKSUM_FILE, "rb") as f:
+                data = f.read()
+            doc = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+            if "schema_version" in doc:
+                return doc.get("files", {})
+            return doc
     except Exception as e:
         print(f"[BACKUP] Error loading checksums: {e}", flush=True)
     return {}
 
 
-def verify_integrity():
+def _record_digest(filepath, record, deep=False):
+    """Return (expected, actual) digests using the algorithm the record was written with."""
+    if CHECKSUM_ALGO in record:
+        return record[CHECKSUM_ALGO], compute_checksum(filepath, use_cache=not deep)
+    if "sha256" in record:
+        return record["sha256"], _legacy_sha256(filepath)
+    return None, None
+
+
+def verify_integrity(deep=False):
     """
     Verify all data files against stored checksums.
+    Files whose mtime_ns and size match the stored record are reported ok
+    without hashing; deep=True re-hashes every file from disk.
     Returns dict with status per file.
     """
     saved = load_checksums()
-    current = generate_checksums()
     results = {}
+    to_hash = []
 
     for filename in DATA_FILES:
         filepath = os.path.join(DATA_DIR, filename)
 
-        if not os.path.exists(filepath):
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             results[filename] = {"status": "missing", "detail": "File not found"}
             continue
 
@@ -125,33 +308,158 @@ def verify_integrity():
             results[filename] = {"status": "no_baseline", "detail": "No stored checksum to compare"}
             continue
 
-        if filename not in current:
-            results[filename] = {"status": "error", "detail": "Could not compute checksum"}
+        record = saved[filename]
+        if (not deep and record.get("mtime_ns") == st.st_mtime_ns
+                and record.get("size") == st.st_size):
+            results[filename] = {"status": "ok", "detail": "Unchanged since last checksum"}
             continue
 
-        if current[filename]["sha256"] == saved[filename]["sha256"]:
-            results[filename] = {"status": "ok", "detail": "Checksum matches"}
-        else:
-            results[filename] = {
-                "status": "modified",
-                "detail": "Checksum mismatch — file changed since last backup",
-                "expected": saved[filename]["sha256"][:16] + "...",
-                "actual": current[filename]["sha256"][:16] + "..."
-            }
-
-    return results
+        to_hash.append(filename)
+
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            digests = list(pool.map(
+                lambda f: _record_digest(os.path.join(DATA_DIR, f), saved[f], deep=deep),
+                to_hash
+            ))
+
+        for filename, (expected, digest) in zip(to_hash, digests):
+            if not expected:
+                results[filename] = {"status": "error", "detail": "Unsupported checksum algorithm in baseline"}
+            elif not digest:
+                results[filename] = {"status": "error", "detail": "Could not compute checksum"}
+            elif digest == expected:
+                results[filename] = {"status": "ok", "detail": "Checksum matches"}
+            else:
+                results[filename] = {
+                    "status": "modified",
+                    "detail": "Checksum mismatch — file changed since last backup",
+                    "expected": expected[:16] + "...",
+                    "actual": digest[:16] + "..."
+                }
+
+    return {filename: results[filename] for filename in DATA_FILES}
 
 
 # =============================================================================
 # BACKUP FUNCTIONS
 # =============================================================================
 
+_SKIPPED = object()
+
+
+def _copy_file(src, dst):
+    """Copy src to dst without routing bytes through Python buffers."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+                remaining = os.fstat(f_in.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(f_in.fileno(), f_out.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass  # e.g. EXDEV/ENOSYS on older kernels - shutil uses sendfile instead
+    shutil.copyfile(src, dst)
+
+
+def _is_backup_file(name):
+    """True for compressed backups and data files stored uncompressed."""
+    return name.endswith(BACKUP_SUFFIXES) or name in DATA_FILES
+
+
+class _HashingReader:
+    """File wrapper that feeds every chunk read through a digest."""
+
+    def __init__(self, f, digest):
+        self.f = f
+        self.digest = digest
+        self.size = 0
+
+    def read(self, n=-1):
+        chunk = self.f.read(n)
+        self.digest.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+
+def _parallel_gzip(reader, f_out):
+    """
+    pigz-style gzip: compress GZIP_CHUNK_SIZE chunks on a worker pool and write
+    them in order as concatenated gzip members (gzip.open reads these back
+    as one stream). At most two chunks per worker are held in memory.
+    """
+    workers = os.cpu_count() or 1
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            chunk = reader.read(GZIP_CHUNK_SIZE)
+            if not chunk:
+                break
+            pending.append(pool.submit(gzip.compress, chunk, GZIP_LEVEL, mtime=0))
+            if len(pending) >= workers * 2:
+                f_out.write(pending.popleft().result())
+        while pending:
+            f_out.write(pending.popleft().result())
+
+
+def _backup_file(filename, backup_subdir, checked_at):
+    """
+    Compress one data file into backup_subdir, hashing it in the same pass.
+    Returns (filename, error, checksum_entry) - error is None on success,
+    _SKIPPED if the file is absent.
+    """
+    filepath = os.path.join(DATA_DIR, filename)
+    if not os.path.exists(filepath):
+        return filename, _SKIPPED, None
+
+    try:
+        with open(filepath, "rb") as f_in:
+            st = os.fstat(f_in.fileno())
+            reader = _HashingReader(f_in, _new_digest())
+            if st.st_size < COMPRESS_MIN_BYTES:
+                with open(os.path.join(backup_subdir, filename), "wb") as f_out:
+                    f_out.write(reader.read())
+            elif HAS_ZSTD:
+                backup_path = os.path.join(backup_subdir, filename + ".zst")
+                cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+                with open(backup_path, "wb") as f_out:
+                    cctx.copy_stream(reader, f_out, size=st.st_size)
+            elif st.st_size >= GZIP_CHUNK_SIZE:
+                backup_path = os.path.join(backup_subdir, filename + ".gz")
+                with open(backup_path, "wb") as f_out:
+                    _parallel_gzip(reader, f_out)
+            else:
+                backup_path = os.path.join(backup_subdir, filename + ".gz")
+                with gzip.open(backup_path, "wb", compresslevel=GZIP_LEVEL) as f_out:
+                    shutil.copyfileobj(reader, f_out, length=COPY_BUFFER_SIZE)
+        digest = reader.digest.hexdigest()
+        # Keyed on the pre-read stat, so a write during the copy forces a rehash later
+        _CHK_CACHE[filepath] = (st.st_mtime_ns, st.st_size, digest)
+        return filename, None, {
+            CHECKSUM_ALGO: digest,
+            "size": reader.size,
+            "mtime_ns": st.st_mtime_ns,
+            "checked_at": checked_at
+        }
+    except Exception as e:
+        return filename, str(e), None
+
+
 def create_backup():
     """
     Create a compressed backup of all data files.
-    Stores as timestamped .gz files in backup directory.
+    Stores as timestamped .zst files (.gz without zstandard) in backup directory;
+    files under COMPRESS_MIN_BYTES are copied uncompressed.
     Returns backup info dict.
     """
+    with _BACKUP_LOCK:
+        return _create_backup()
+
+
+def _create_backup():
     os.makedirs(BACKUP_DIR, exist_ok=True)
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -161,30 +469,26 @@ def create_backup():
     backed_up = []
     errors = []
 
-    for filename in DATA_FILES:
-        filepath = os.path.join(DATA_DIR, filename)
-        if not os.path.exists(filepath):
-            continue
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        now_iso = _utc_timestamp()
+        results = list(pool.map(lambda f: _backup_file(f, backup_subdir, now_iso), DATA_FILES))
 
-        try:
-            backup_path = os.path.join(backup_subdir, filename + ".gz")
-            with open(filepath, "rb") as f_in:
-                with gzip.open(backup_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+    checksums = {}
+    for filename, error, entry in results:
+        if error is None:
             backed_up.append(filename)
-        except Exception as e:
-            errors.append({"file": filename, "error": str(e)})
-            print(f"[BACKUP] Error backing up {filename}: {e}", flush=True)
+            checksums[filename] = entry
+        elif error is not _SKIPPED:
+            errors.append({"file": filename, "error": error})
+            print(f"[BACKUP] Error backing up {filename}: {error}", flush=True)
 
-    # Save current checksums as baseline
-    checksums = generate_checksums()
+    # Save checksums from the backup pass as baseline
     save_checksums(checksums)
 
     # Save checksums into backup too
     try:
         checksum_backup = os.path.join(backup_subdir, "checksums.json")
-        with open(checksum_backup, "w") as f:
-            json.dump(checksums, f, indent=2)
+        _atomic_write(checksum_backup, _serialize_checksums(checksums))
     except Exception:
         pass
 
@@ -203,61 +507,142 @@ def create_backup():
     return backup_info
 
 
+def _backup_dirs():
+    """Return backup subdirectory names via one scandir pass (no per-entry stat)."""
+    try:
+        with os.scandir(BACKUP_DIR) as it:
+            return [e.name for e in it if e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
+def _remove_backup_dirs(paths):
+    """
+    Delete expired backup directories.
+    Backup dirs are flat, so all file unlinks are batched onto the worker pool
+    and the emptied directories are removed afterwards.
+    """
+    files = []
+    nested = []
+    for path in paths:
+        with os.scandir(path) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    nested.append(e.path)
+                else:
+                    files.append(e.path)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        list(pool.map(os.unlink, files))
+
+    for path in nested:
+        shutil.rmtree(path)
+    for path in paths:
+        os.rmdir(path)
+
+
 def rotate_backups():
     """Remove backups older than MAX_BACKUPS days."""
-    if not os.path.exists(BACKUP_DIR):
-        return
-
     cutoff = datetime.utcnow() - timedelta(days=MAX_BACKUPS)
-    removed = 0
-
-    for entry in sorted(os.listdir(BACKUP_DIR)):
-        entry_path = os.path.join(BACKUP_DIR, entry)
-        if not os.path.isdir(entry_path):
-            continue
+    expired = []
 
+    for entry in sorted(_backup_dirs()):
         try:
             backup_time = datetime.strptime(entry, "%Y%m%d_%H%M%S")
-            if backup_time < cutoff:
-                shutil.rmtree(entry_path)
-                removed += 1
-                print(f"[BACKUP] Rotated old backup: {entry}", flush=True)
         except ValueError:
             continue
+        if backup_time < cutoff:
+            expired.append(entry)
 
-    if removed:
-        print(f"[BACKUP] Removed {removed} old backup(s)", flush=True)
+    if not expired:
+        return
+
+    try:
+        _remove_backup_dirs([os.path.join(BACKUP_DIR, e) for e in expired])
+    except OSError as e:
+        print(f"[BACKUP] Error rotating old backups: {e}", flush=True)
+        return
+
+    for entry in expired:
+        print(f"[BACKUP] Rotated old backup: {entry}", flush=True)
+    print(f"[BACKUP] Removed {len(expired)} old backup(s)", flush=True)
 
 
 def list_backups():
     """List available backups with file counts."""
-    if not os.path.exists(BACKUP_DIR):
-        return []
-
     backups = []
-    for entry in sorted(os.listdir(BACKUP_DIR), reverse=True):
+    for entry in sorted(_backup_dirs(), reverse=True):
         entry_path = os.path.join(BACKUP_DIR, entry)
-        if not os.path.isdir(entry_path):
-            continue
 
-        files = [f for f in os.listdir(entry_path) if f.endswith(".gz")]
-        total_size = sum(os.path.getsize(os.path.join(entry_path, f)) for f in os.listdir(entry_path))
+        files = 0
+        total_size = 0
+        with os.scandir(entry_path) as it:
+            for e in it:
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                total_size += e.stat(follow_symlinks=False).st_size
+                if _is_backup_file(e.name):
+                    files += 1
 
         backups.append({
             "timestamp": entry,
-            "files": len(files),
+            "files": files,
             "total_size_bytes": total_size
         })
 
     return backups
 
 
+def _restore_file(backup_file, backup_subdir):
+    """
+    Restore one backup file (.zst, legacy .gz, or uncompressed) into DATA_DIR.
+    Data is written to a temp file and renamed over the target, so a failed
+    restore never leaves a half-written data file.
+    Returns (filename, error) - error is None on success.
+    """
+    if backup_file in DATA_FILES:
+        filename, ext = backup_file, ""
+    else:
+        filename, ext = os.path.splitext(backup_file)
+    restore_path = os.path.join(DATA_DIR, filename)
+    tmp_path = restore_path + ".tmp"
+    backup_path = os.path.join(backup_subdir, backup_file)
+
+    try:
+        if ext == ".zst":
+            if not HAS_ZSTD:
+                return filename, "zstandard is not installed; cannot restore .zst backup"
+            dctx = zstd.ZstdDecompressor()
+            with open(backup_path, "rb") as f_in:
+                with open(tmp_path, "wb") as f_out:
+                    dctx.copy_stream(f_in, f_out)
+        elif ext == ".gz":
+            with gzip.open(backup_path, "rb") as f_in:
+                with open(tmp_path, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out, length=COPY_BUFFER_SIZE)
+        else:
+            _copy_file(backup_path, tmp_path)
+        os.replace(tmp_path, restore_path)
+        return filename, None
+    except Exception as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return filename, str(e)
+
+
 def restore_from_backup(timestamp=None):
     """
     Restore data files from a backup.
     If no timestamp given, uses the most recent backup.
     Verifies checksums after restore.
     """
+    with _BACKUP_LOCK:
+        return _restore_from_backup(timestamp)
+
+
+def _restore_from_backup(timestamp):
     if not os.path.exists(BACKUP_DIR):
         return {"success": False, "error": "No backups directory found"}
 
@@ -265,10 +650,7 @@ def restore_from_backup(timestamp=None):
         backup_subdir = os.path.join(BACKUP_DIR, timestamp)
     else:
         # Find most recent
-        entries = sorted([
-            e for e in os.listdir(BACKUP_DIR)
-            if os.path.isdir(os.path.join(BACKUP_DIR, e))
-        ], reverse=True)
+        entries = sorted(_backup_dirs(), reverse=True)
 
         if not entries:
             return {"success": False, "error": "No backups available"}
@@ -282,22 +664,16 @@ def restore_from_backup(timestamp=None):
     restored = []
     errors = []
 
-    for gz_file in os.listdir(backup_subdir):
-        if not gz_file.endswith(".gz"):
-            continue
-
-        filename = gz_file[:-3]  # Remove .gz
-        restore_path = os.path.join(DATA_DIR, filename)
+    backup_files = [f for f in os.listdir(backup_subdir) if _is_backup_file(f)]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = list(pool.map(lambda f: _restore_file(f, backup_subdir), backup_files))
 
-        try:
-            gz_path = os.path.join(backup_subdir, gz_file)
-            with gzip.open(gz_path, "rb") as f_in:
-                with open(restore_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+    for filename, error in results:
+        if error is None:
             restored.append(filename)
-        except Exception as e:
-            errors.append({"file": filename, "error": str(e)})
-            print(f"[BACKUP] Error restoring {filename}: {e}", flush=True)
+        else:
+            errors.append({"file": filename, "error": error})
+            print(f"[BACKUP] Error restoring {filename}: {error}", flush=True)
 
     # Restore checksums if available
     checksum_backup = os.path.join(backup_subdir, "checksums.json")
@@ -307,6 +683,8 @@ def restore_from_backup(timestamp=None):
         except Exception:
             pass
 
+    clear_checksum_cache()
+
     result = {
         "success": len(errors) == 0,
         "timestamp": timestamp,
@@ -323,8 +701,10 @@ def restore_from_backup(timestamp=None):
 # STARTUP AUTO-BACKUP
 # =============================================================================
 
-def run_startup_backup():
-    """Run backup on app startup. Called from main app."""
+def _do_startup_backup():
+    if not os.path.isdir(DATA_DIR):
+        print(f"[BACKUP] Startup backup skipped: {DATA_DIR} does not exist", flush=True)
+        return None
     try:
         print("[BACKUP] Running startup backup...", flush=True)
         info = create_backup()
@@ -335,6 +715,16 @@ def run_startup_backup():
         return None
 
 
+def run_startup_backup():
+    """
+    Start the startup backup on a background thread. Called from bridge_web's
+    __main__ block so importing the app (tests, scripts) never triggers it.
+    """
+    t = threading.Thread(target=_do_startup_backup, name="startup-backup", daemon=True)
+    t.start()
+    return {"queued": True}
+
+
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
@@ -345,8 +735,8 @@ def require_admin_key(f):
 
     @wraps(f)
     def decorated(*args, **kwargs):
-        key = request.headers.get("X-Admin-Key", "")
-        if not ADMIN_KEY or key != ADMIN_KEY:
+        key = request.headers.get("X-Admin-Key", "").encode()
+        if not _ADMIN_KEY_B or not hmac.compare_digest(key, _ADMIN_KEY_B):
             return jsonify({"error": "Unauthorized"}), 401
         return f(*args, **kwargs)
 
@@ -387,8 +777,9 @@ def get_backups():
 
 @backup_bp.route('/api/v1/backup/verify', methods=['GET'])
 def verify_data():
-    """Public endpoint: verify data integrity."""
-    results = verify_integrity()
+    """Public endpoint: verify data integrity. ?deep=1 forces a full re-hash."""
+    deep = request.args.get("deep", "").lower() in ("1", "true", "yes")
+    results = verify_integrity(deep=deep)
     all_ok = all(r["status"] in ("ok", "no_baseline") for r in results.values())
     return jsonify({"success": True, "healthy": all_ok, "files": results})
 
@@ -5,13 +5,17 @@ Provides structured error responses, detailed error codes, and security-aware
 error messages that inform clients without leaking internal system details.
 """
 
-import re
 from enum import Enum
 from typing import Tuple, Dict, Optional, Any
+from urllib.parse import urlsplit
 
 
-class ScraperErrorCode(Enum):
-    """Error codes for scraper endpoint responses."""
+class ScraperErrorCode(str, Enum):
+    """
+    Error codes for scraper endpoint responses.
+    
+    Members are str instances, so they serialize to JSON as their value.
+    """
     
     # Input validation errors (4xx)
     MISSING_URL = "missing_url"
@@ -68,13 +72,67 @@ class ScraperError(Exception):
         """Convert error to Flask JSON response format."""
         response = {
             'success': False,
-            'error': self.error_code.value,
+            'error': self.error_code,
             'message': self.message
         }
         response.update(self.extra_details)
         return response, self.status_code
 
 
+# Fixed messages for the most frequent target-server failures
+_HTTP_ERROR_MESSAGES = {
+    401: "The target server requires authentication (HTTP 401).",
+    403: "Access to the target URL is forbidden (HTTP 403).",
+    404: "The target URL was not found (HTTP 404). Check the URL and try again.",
+    429: "The target server is rate limiting requests (HTTP 429). Try again later.",
+    500: "The target server returned an error (HTTP 500). Try again later.",
+    502: "The target server returned an error (HTTP 502). Try again later.",
+    503: "The target server returned an error (HTTP 503). Try again later.",
+}
+
+# ScraperError arguments for each network failure; a fresh error is built per call
+_TIMEOUT_ARGS = (
+    ScraperErrorCode.TIMEOUT,
+    "Request timed out. The target server took too long to respond.",
+    504
+)
+_SSL_ARGS = (
+    ScraperErrorCode.SSL_ERROR,
+    "SSL/TLS certificate error. The target server's certificate is invalid or untrusted.",
+    502
+)
+_DNS_ARGS = (
+    ScraperErrorCode.DNS_ERROR,
+    "Unable to resolve domain name. Check that the domain is valid and accessible.",
+    502
+)
+_CONNECTION_REFUSED_ARGS = (
+    ScraperErrorCode.CONNECTION_ERROR,
+    "Connection refused. The target server rejected the connection.",
+    502
+)
+_HOST_UNREACHABLE_ARGS = (
+    ScraperErrorCode.HOST_UNREACHABLE,
+    "Host is unreachable. Check that the host address is valid.",
+    502
+)
+_CONNECTION_ARGS = (
+    ScraperErrorCode.CONNECTION_ERROR,
+    "Failed to connect to the target server. Check the URL and try again.",
+    502
+)
+_REQUEST_ARGS = (
+    ScraperErrorCode.HTTP_ERROR,
+    "HTTP request failed. Please verify the URL and try again.",
+    502
+)
+_UNEXPECTED_FETCH_ARGS = (
+    ScraperErrorCode.INTERNAL_ERROR,
+    "An unexpected error occurred while fetching the URL.",
+    500
+)
+
+
 def validate_url(url: str) -> Tuple[bool, Optional[ScraperError]]:
     """
     Validate URL format and safety.
@@ -98,15 +156,26 @@ def validate_url(url: str) -> Tuple[bool, Optional[ScraperError]]:
         )
     
     # Check URL format
-    if not re.match(r'^https?://', url, re.IGNORECASE):
+    if not url[:8].lower().startswith(('http://', 'https://')):
         return False, ScraperError(
             ScraperErrorCode.INVALID_URL,
             "URL must start with http:// or https://",
             400
         )
     
+    # urlsplit is lru_cached, so the later security check in bridge_web
+    # (urlsplit of the same string) reuses this parse
+    try:
+        parsed = urlsplit(url)
+    except ValueError:
+        return False, ScraperError(
+            ScraperErrorCode.INVALID_URL,
+            "URL is malformed",
+            400
+        )
+    
     # Check for embedded credentials
-    if re.search(r'[a-zA-Z0-9]+://[^/]*@', url):
+    if '@' in parsed.netloc:
         return False, ScraperError(
             ScraperErrorCode.INVALID_URL,
             "URLs with embedded credentials are not allowed",
@@ -202,67 +271,34 @@ def network_error_to_scraper_error(
     """
     import requests
     
-    exc_type = type(exc).__name__
     exc_str = str(exc)
     
     # Timeout
     if isinstance(exc, requests.Timeout):
-        return ScraperError(
-            ScraperErrorCode.TIMEOUT,
-            "Request timed out. The target server took too long to respond.",
-            504
-        )
+        return ScraperError(*_TIMEOUT_ARGS)
     
     # SSL/TLS certificate errors (must come before ConnectionError — SSLError is a subclass)
     if isinstance(exc, requests.exceptions.SSLError):
-        return ScraperError(
-            ScraperErrorCode.SSL_ERROR,
-            "SSL/TLS certificate error. The target server's certificate is invalid or untrusted.",
-            502
-        )
+        return ScraperError(*_SSL_ARGS)
     
     # Connection errors
     if isinstance(exc, requests.ConnectionError):
         # Try to determine the specific type
         if 'Name or service not known' in exc_str or 'Failed to resolve' in exc_str:
-            return ScraperError(
-                ScraperErrorCode.DNS_ERROR,
-                "Unable to resolve domain name. Check that the domain is valid and accessible.",
-                502
-            )
+            return ScraperError(*_DNS_ARGS)
         elif 'Connection refused' in exc_str:
-            return ScraperError(
-                ScraperErrorCode.CONNECTION_ERROR,
-                "Connection refused. The target server rejected the connection.",
-                502
-            )
+            return ScraperError(*_CONNECTION_REFUSED_ARGS)
         elif 'Network is unreachable' in exc_str:
-            return ScraperError(
-                ScraperErrorCode.HOST_UNREACHABLE,
-                "Host is unreachable. Check that the host address is valid.",
-                502
-            )
+            return ScraperError(*_HOST_UNREACHABLE_ARGS)
         else:
-            return ScraperError(
-                ScraperErrorCode.CONNECTION_ERROR,
-                "Failed to connect to the target server. Check the URL and try again.",
-                502
-            )
+            return ScraperError(*_CONNECTION_ARGS)
     
     # Generic request exception
     if isinstance(exc, requests.RequestException):
-        return ScraperError(
-            ScraperErrorCode.HTTP_ERROR,
-            "HTTP request failed. Please verify the URL and try again.",
-            502
-        )
+        return ScraperError(*_REQUEST_ARGS)
     
     # Unknown error
-    return ScraperError(
-        ScraperErrorCode.INTERNAL_ERROR,
-        "An unexpected error occurred while fetching the URL.",
-        500
-    )
+    return ScraperError(*_UNEXPECTED_FETCH_ARGS)
 
 
 def content_parsing_error(
@@ -331,39 +367,17 @@ def validate_http_status(status_code: int) -> Tuple[bool, Optional[ScraperError]
     if 300 <= status_code < 400:
         return True, None  # Should not reach here due to redirect handling
     
-    # 4xx - Client errors
-    if status_code == 401:
+    # Common 4xx/5xx codes have fixed messages
+    message = _HTTP_ERROR_MESSAGES.get(status_code)
+    if message is not None:
         return False, ScraperError(
             ScraperErrorCode.HTTP_ERROR,
-            "The target server requires authentication (HTTP 401).",
-            502,
-            {'status_code': status_code}
-        )
-    
-    if status_code == 403:
-        return False, ScraperError(
-            ScraperErrorCode.HTTP_ERROR,
-            "Access to the target URL is forbidden (HTTP 403).",
-            502,
-            {'status_code': status_code}
-        )
-    
-    if status_code == 404:
-        return False, ScraperError(
-            ScraperErrorCode.HTTP_ERROR,
-            "The target URL was not found (HTTP 404). Check the URL and try again.",
-            502,
-            {'status_code': status_code}
-        )
-    
-    if status_code == 429:
-        return False, ScraperError(
-            ScraperErrorCode.HTTP_ERROR,
-            "The target server is rate limiting requests (HTTP 429). Try again later.",
+            message,
             502,
             {'status_code': status_code}
         )
     
+    # 4xx - Client errors
     if 400 <= status_code < 500:
         return False, ScraperError(
             ScraperErrorCode.HTTP_ERROR,
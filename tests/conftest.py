@@ -0,0 +1,108 @@
+"""
+Shared test helpers and fixtures for the scraper test modules.
+"""
+
+import io
+import json
+import sys
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def response_json(response):
+    """Decode a test response body directly, skipping Flask's get_json machinery."""
+    return orjson.loads(response.data) if HAS_ORJSON else json.loads(response.data)
+
+
+@dataclass(slots=True)
+class MockResponse:
+    """Mock response object for testing."""
+    
+    content: bytes = b''
+    status_code: int = 200
+    encoding: str = 'utf-8'
+    headers: dict = field(default_factory=dict)
+    
+    def iter_content(self, chunk_size=65536):
+        """Iterate over response content; chunking is done by BytesIO.read in C."""
+        if len(self.content) <= chunk_size:
+            # Small bodies go out in one piece, no slicing
+            yield self.content
+            return
+        buf = io.BytesIO(self.content)
+        while chunk := buf.read(chunk_size):
+            yield chunk
+    
+    def close(self):
+        """Nothing to release; present because scrapers close responses."""
+
+
+@pytest.fixture(autouse=True)
+def reset_bridge_state():
+    """
+    Clear bridge_web's in-memory rate-limit windows, API key cache and pending
+    usage counts before each test so results don't depend on test order or on
+    how pytest-xdist splits the run.
+    """
+    bridge_web = sys.modules.get("bridge_web")
+    if bridge_web is not None:
+        for store in (
+            bridge_web._rate_limit_ip,
+            bridge_web._rate_limit_url,
+            bridge_web._rate_limit_api_key,
+            bridge_web._rate_limit_api_key_url,
+        ):
+            store.clear()
+        if bridge_web._api_key_cache is not None:
+            bridge_web._api_key_cache.clear()
+        bridge_web._api_key_usage.clear()
+        bridge_web.limiter.reset()
+    yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    One bridge_web test client for the whole run. Tests only change app state
+    through monkeypatch/stub_bridge, which revert after each test.
+    """
+    import bridge_web
+
+    return bridge_web.app.test_client(use_cookies=False)
+
+
+@pytest.fixture
+def stub_bridge():
+    """
+    Stub bridge_web's URL, IP rate-limit, API key and payment checks plus the
+    upstream fetch. Defaults let a paid request through; tests tweak the
+    mocks as needed.
+    """
+    import bridge_web
+
+    ns = SimpleNamespace(
+        fetch=Mock(),
+        verify=Mock(return_value=(True, None, None)),
+        validate_url=Mock(return_value=True),
+        rate_limit=Mock(return_value=(True, None)),
+        api_key=Mock(return_value=None),
+    )
+    with patch.multiple(
+        bridge_web,
+        _validate_scrape_url=ns.validate_url,
+        _check_rate_limit=ns.rate_limit,
+        _validate_api_key=ns.api_key,
+        verify_watt_payment=ns.verify,
+        _fetch_with_redirects=ns.fetch,
+    ):
+        yield ns
+
@@ -1,63 +1,49 @@
 import json
 
+import pytest
+
 import bridge_web
+from conftest import MockResponse, response_json
 from scraper_errors import ScraperErrorCode
 
 
 def _mock_response(body_bytes, status_code=200, encoding="utf-8"):
-    class MockResponse:
-        def __init__(self):
-            self.status_code = status_code
-            self.encoding = encoding
-            self.headers = {}
-
-        def iter_content(self, chunk_size=8192):
-            yield body_bytes
-
-    return MockResponse()
+    return MockResponse(content=body_bytes, status_code=status_code, encoding=encoding)
 
 
-def test_scrape_requires_url(monkeypatch):
+def test_scrape_requires_url(client, monkeypatch):
     """Test that URL is required."""
-    client = bridge_web.app.test_client()
     response = client.post("/api/v1/scrape", json={"format": "text"})
     assert response.status_code == 400
-    data = response.get_json()
+    data = response_json(response)
     assert data["success"] is False
     assert data["error"] == ScraperErrorCode.MISSING_URL.value
 
 
-def test_scrape_invalid_format(monkeypatch):
+def test_scrape_invalid_format(client, monkeypatch):
     """Test that invalid format is rejected."""
-    client = bridge_web.app.test_client()
     response = client.post("/api/v1/scrape", json={"url": "https://example.com", "format": "xml"})
     assert response.status_code == 400
-    data = response.get_json()
+    data = response_json(response)
     assert data["success"] is False
     assert data["error"] == ScraperErrorCode.INVALID_FORMAT.value
 
 
-def test_scrape_invalid_url(monkeypatch):
+def test_scrape_invalid_url(client, monkeypatch):
     """Test that invalid URLs are blocked."""
     monkeypatch.setattr(bridge_web, "_validate_scrape_url", lambda _url: False)
-    client = bridge_web.app.test_client()
     response = client.post("/api/v1/scrape", json={"url": "http://localhost", "format": "text"})
     assert response.status_code == 400
-    data = response.get_json()
+    data = response_json(response)
     assert data["success"] is False
     assert data["error"] == ScraperErrorCode.URL_BLOCKED.value
 
 
-def test_scrape_text_success(monkeypatch):
+def test_scrape_text_success(client, stub_bridge):
     """Test successful text scraping with payment."""
-    monkeypatch.setattr(bridge_web, "_validate_scrape_url", lambda _url: True)
-    monkeypatch.setattr(bridge_web, "_check_rate_limit", lambda _ip, _url: (True, None))
     html = b"<html><body><h1>Hello</h1></body></html>"
-    monkeypatch.setattr(bridge_web, "_fetch_with_redirects", lambda _url, _headers: _mock_response(html))
-    # Mock payment verification
-    monkeypatch.setattr(bridge_web, "verify_watt_payment", lambda sig, wallet, amt: (True, None, None))
+    stub_bridge.fetch.return_value = _mock_response(html)
 
-    client = bridge_web.app.test_client()
     response = client.post("/api/v1/scrape", json={
         "url": "https://example.com",
         "format": "text",
@@ -65,22 +51,17 @@ def test_scrape_text_success(monkeypatch):
         "tx_signature": "test_sig"
     })
     assert response.status_code == 200
-    data = response.get_json()
+    data = response_json(response)
     assert data["success"] is True
     assert data["format"] == "text"
     assert data["content"] == "Hello"
 
 
-def test_scrape_json_success(monkeypatch):
+def test_scrape_json_success(client, stub_bridge):
     """Test successful JSON scraping with payment."""
-    monkeypatch.setattr(bridge_web, "_validate_scrape_url", lambda _url: True)
-    monkeypatch.setattr(bridge_web, "_check_rate_limit", lambda _ip, _url: (True, None))
     payload = json.dumps({"ok": True}).encode("utf-8")
-    monkeypatch.setattr(bridge_web, "_fetch_with_redirects", lambda _url, _headers: _mock_response(payload))
-    # Mock payment verification
-    monkeypatch.setattr(bridge_web, "verify_watt_payment", lambda sig, wallet, amt: (True, None, None))
+    stub_bridge.fetch.return_value = _mock_response(payload)
 
-    client = bridge_web.app.test_client()
     response = client.post("/api/v1/scrape", json={
         "url": "https://example.com",
         "format": "json",
@@ -88,6 +69,86 @@ def test_scrape_json_success(monkeypatch):
         "tx_signature": "test_sig"
     })
     assert response.status_code == 200
-    data = response.get_json()
+    data = response_json(response)
     assert data["success"] is True
     assert data["content"] == {"ok": True}
+
+
+@pytest.mark.parametrize("body, expected", [
+    (b'{"n": NaN}', "nan"),
+    (b'{"s": "\\ud800"}', "\ud800"),
+    (b'{"n": 123456789012345678901234567890}', 123456789012345678901234567890),
+])
+def test_request_json_matches_stdlib(body, expected):
+    """Request bodies parse exactly as the stdlib json module would."""
+    with bridge_web.app.test_request_context(data=body, content_type="application/json"):
+        value = next(iter(bridge_web.request.get_json().values()))
+    if expected == "nan":
+        assert value != value
+    else:
+        assert value == expected
+        assert type(value) is type(expected)
+
+
+def test_validate_api_key_cached(monkeypatch):
+    """Valid API keys are served from the TTL cache; unknown keys are not cached."""
+    if bridge_web._api_key_cache is None:
+        pytest.skip("cachetools not installed")
+    loads = []
+
+    def _fake_load():
+        loads.append(1)
+        return {"keys": {"good": {"status": "active", "tier": "basic"}}}
+
+    monkeypatch.setattr(bridge_web, "_load_api_keys", _fake_load)
+    assert bridge_web._validate_api_key("good")["tier"] == "basic"
+    assert bridge_web._validate_api_key("good")["tier"] == "basic"
+    assert bridge_web._validate_api_key("bad") is None
+    assert bridge_web._validate_api_key("bad") is None
+    assert len(loads) == 3
+
+
+def test_validate_api_key_revoked_immediately(tmp_path, monkeypatch):
+    """Revoking a key in api_keys.json takes effect on the very next check."""
+    keys_file = tmp_path / "api_keys.json"
+    monkeypatch.setattr(bridge_web, "API_KEYS_FILE", str(keys_file))
+    keys_file.write_text(json.dumps({"keys": {"k": {"status": "active", "tier": "basic"}}}))
+    assert bridge_web._validate_api_key("k")["tier"] == "basic"
+
+    # Written the way admin_blueprint.revoke_api_key does, outside bridge_web
+    keys_file.write_text(json.dumps({"keys": {"k": {"status": "revoked", "tier": "basic"}}}))
+    assert bridge_web._validate_api_key("k") is None
+
+
+def test_api_key_usage_flushed_in_batches(tmp_path, monkeypatch):
+    """Keyed requests are counted in memory and written back in one batch."""
+    keys_file = tmp_path / "api_keys.json"
+    monkeypatch.setattr(bridge_web, "API_KEYS_FILE", str(keys_file))
+    monkeypatch.setattr(bridge_web, "API_KEY_USAGE_FLUSH_SECONDS", 3600)
+    keys_file.write_text(json.dumps({"keys": {"k": {"status": "active", "usage_count": 5}}}))
+    before = keys_file.stat().st_mtime_ns
+
+    for _ in range(3):
+        bridge_web._increment_api_key_usage("k")
+    bridge_web._increment_api_key_usage("unknown")
+    assert keys_file.stat().st_mtime_ns == before
+
+    bridge_web._flush_api_key_usage()
+    key = json.loads(keys_file.read_text())["keys"]["k"]
+    assert key["usage_count"] == 8
+    assert key["last_used"].endswith("Z")
+
+
+def test_save_after_outside_write_drops_cache(tmp_path, monkeypatch):
+    """A revoke written between our checks and our own save still evicts the key."""
+    if bridge_web._api_key_cache is None:
+        pytest.skip("cachetools not installed")
+    keys_file = tmp_path / "api_keys.json"
+    monkeypatch.setattr(bridge_web, "API_KEYS_FILE", str(keys_file))
+    keys_file.write_text(json.dumps({"keys": {"k": {"status": "active", "tier": "basic"}}}))
+    assert bridge_web._validate_api_key("k")["tier"] == "basic"
+
+    stale = bridge_web._load_api_keys()
+    keys_file.write_text(json.dumps({"keys": {"k": {"status": "revoked", "tier": "basic"}}}))
+    bridge_web._save_api_keys(stale)  # e.g. a usage flush that loaded before the revoke
+    assert "k" not in bridge_web._api_key_cache
@@ -9,13 +9,31 @@ Usage:
     python tip_transfer.py validate <address>
 """
 
+import copy
+import functools
+import os
+import re
+import stat
 import sys
+import tempfile
 import json
-import base58
 import struct
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+# Address decoding: based58 (Rust) when installed, else the base58 package
+try:
+    from based58 import b58decode
+except ImportError:
+    from base58 import b58decode
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Solana RPC endpoint
 SOLANA_RPC = "https://api.mainnet-beta.solana.com"
 
@@ -28,49 +46,237 @@ WATT_DECIMALS = 6
 # Tip tracker file
 TRACKER_FILE = Path(__file__).parent / "tip_tracker.json"
 
+# Base58 alphabet (no 0, O, I, l); a 32-byte key encodes to 32-44 chars
+B58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_ADDRESS_RE = re.compile("[%s]{32,44}" % B58_ALPHABET.decode())
+
 
 def validate_solana_address(address: str) -> bool:
     """Validate a Solana address format."""
+    # Reject bad characters and lengths before paying for a decode
+    if not isinstance(address, str) or not _B58_ADDRESS_RE.fullmatch(address):
+        return False
+    return _decodes_to_pubkey(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def _decodes_to_pubkey(address: str) -> bool:
+    """True if *address* base58-decodes to 32 bytes. Inputs are <= 44 chars, so the cache stays small."""
     try:
-        decoded = base58.b58decode(address)
-        return len(decoded) == 32
-    except Exception:
+        return len(b58decode(address.encode("ascii"))) == 32
+    except ValueError:
         return False
 
 
-def load_tracker() -> dict:
-    """Load tip tracker from JSON file."""
+# Mutations are appended to a JSONL journal next to the tracker instead of
+# rewriting the whole file; save_tracker() folds the journal back in, and
+# main() does so before the CLI exits so the snapshot stays authoritative.
+JOURNAL_COMPACT_EVENTS = 10_000
+
+# Tracker path -> _TrackerState for the last load/save of that file
+_TRACKER_CACHE = {}
+# Events held back by tracker_batch(), or None when not batching
+_PENDING_EVENTS = None
+
+
+class _TrackerState:
+    """A loaded tracker plus tip_id / comment_id indexes over its tips."""
+    __slots__ = ("stamp", "data", "events", "repair_at", "by_id", "by_comment")
+    
+    def __init__(self, stamp, data: dict, events: int, repair_at: int = None):
+        self.stamp = stamp
+        self.data = data
+        self.events = events
+        # Journal offset to cut a torn tail back to before the next append
+        self.repair_at = repair_at
+        # setdefault keeps the first match, as the old linear scans did
+        self.by_id = {}
+        self.by_comment = {}
+        for tip in data["tips"]:
+            self.index(tip)
+    
+    def index(self, tip: dict):
+        self.by_id.setdefault(tip.get("tip_id"), tip)
+        self.by_comment.setdefault(tip.get("comment_id"), tip)
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes ending in a newline, via orjson when available."""
+    if HAS_ORJSON:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return (json.dumps(obj, indent=2 if indent else None) + "\n").encode()
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _journal_file() -> Path:
+    return TRACKER_FILE.with_suffix(".jsonl")
+
+
+def _file_stamp(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _tracker_stamp():
+    return (_file_stamp(TRACKER_FILE), _file_stamp(_journal_file()))
+
+
+def _apply_event(data: dict, event: dict, tips_by_id: dict):
+    """Replay one journal event. Events carry the resulting stats, so replaying twice is harmless."""
+    if event["op"] == "add":
+        tip = event["tip"]
+        if tip["tip_id"] not in tips_by_id:
+            data["tips"].append(tip)
+            tips_by_id[tip["tip_id"]] = tip
+    else:  # claim / sent
+        tips_by_id[event["tip_id"]].update(event["fields"])
+    data["stats"] = event["stats"]
+
+
+def _load_state() -> _TrackerState:
+    stamp = _tracker_stamp()
+    cached = _TRACKER_CACHE.get(TRACKER_FILE)
+    if cached and cached.stamp == stamp:
+        return cached
+    
     if TRACKER_FILE.exists():
-        with open(TRACKER_FILE, 'r') as f:
-            return json.load(f)
-    return {
-        "tips": [],
-        "stats": {
-            "total_issued": 0,
-            "total_claimed": 0,
-            "total_sent": 0,
-            "total_watt_distributed": 0
+        with open(TRACKER_FILE, 'rb') as f:
+            data = _loads(f.read())
+    else:
+        data = {
+            "tips": [],
+            "stats": {
+                "total_issued": 0,
+                "total_claimed": 0,
+                "total_sent": 0,
+                "total_watt_distributed": 0
+            }
         }
-    }
+    
+    events = 0
+    repair_at = None
+    journal = _journal_file()
+    if journal.exists():
+        tips_by_id = {tip["tip_id"]: tip for tip in data["tips"]}
+        good = 0  # byte offset just past the last complete event
+        with open(journal, 'rb') as f:
+            for line in f:
+                try:
+                    event = _loads(line)
+                except json.JSONDecodeError:  # orjson's error subclasses this
+                    break  # torn final line from an interrupted write
+                _apply_event(data, event, tips_by_id)
+                events += 1
+                good += len(line)
+            # A torn or unterminated tail is fixed by the next write, or the
+            # next event would be glued onto it and lost on every later replay
+            if f.seek(0, os.SEEK_END) > good or (good and not line.endswith(b"\n")):
+                repair_at = good
+    
+    state = _TRACKER_CACHE[TRACKER_FILE] = _TrackerState(stamp, data, events, repair_at)
+    return state
+
+
+def load_tracker() -> dict:
+    """Load tip tracker from JSON file, replaying any journaled changes."""
+    return copy.deepcopy(_load_state().data)
 
 
 def save_tracker(data: dict):
-    """Save tip tracker to JSON file."""
-    with open(TRACKER_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save tip tracker to JSON file and clear the journal it now includes."""
+    # Write a sibling temp file, fsync, then rename over the tracker so a
+    # crash never leaves a half-written tip database behind
+    with tempfile.NamedTemporaryFile(
+        'wb', dir=TRACKER_FILE.parent, prefix=TRACKER_FILE.name, suffix='.tmp', delete=False
+    ) as f:
+        try:
+            f.write(_dumps(data, indent=True))
+            f.flush()
+            os.fsync(f.fileno())
+            # mkstemp creates 0600; keep the tracker's existing permissions
+            try:
+                mode = stat.S_IMODE(TRACKER_FILE.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(f.name, mode)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, TRACKER_FILE)
+    # Snapshot first, then truncate: a crash in between only replays
+    # events the snapshot already has, which _apply_event tolerates
+    _journal_file().unlink(missing_ok=True)
+    _TRACKER_CACHE[TRACKER_FILE] = _TrackerState(_tracker_stamp(), data, 0)
+
+
+def _repair_journal_tail(offset: int):
+    """Drop a torn final line and make sure the journal ends in a newline."""
+    with open(_journal_file(), 'r+b') as f:
+        f.truncate(offset)
+        if offset:
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+
+def _write_events(events: list):
+    """Append events to the journal and compact it once it gets long."""
+    state = _TRACKER_CACHE[TRACKER_FILE]
+    if state.repair_at is not None:
+        _repair_journal_tail(state.repair_at)
+        state.repair_at = None
+    with open(_journal_file(), 'ab') as f:
+        f.write(b"".join(_dumps(e) for e in events))
+    state.events += len(events)
+    if state.events >= JOURNAL_COMPACT_EVENTS:
+        save_tracker(state.data)
+    else:
+        state.stamp = _tracker_stamp()
+
+
+def _append_event(event: dict):
+    if _PENDING_EVENTS is not None:
+        _PENDING_EVENTS.append(event)
+    else:
+        _write_events([event])
+
+
+@contextmanager
+def tracker_batch():
+    """Group tracker changes into a single journal write on exit."""
+    global _PENDING_EVENTS
+    if _PENDING_EVENTS is not None:
+        yield  # already inside a batch
+        return
+    _PENDING_EVENTS = []
+    try:
+        yield
+    finally:
+        events, _PENDING_EVENTS = _PENDING_EVENTS, None
+        if events:
+            _write_events(events)
 
 
 def add_tip(recipient_agent: str, amount: int, comment_id: str, post_id: str = "f97ae476-f989-4555-a537-3634c6107012") -> dict:
     """Add a new pending tip to the tracker."""
     import uuid
     
-    tracker = load_tracker()
+    state = _load_state()
+    tracker = state.data
     
     # Check for duplicate
-    for tip in tracker["tips"]:
-        if tip["comment_id"] == comment_id:
-            print(f"⚠️  Tip already exists for comment {comment_id}")
-            return tip
+    tip = state.by_comment.get(comment_id)
+    if tip is not None:
+        print(f"⚠️  Tip already exists for comment {comment_id}")
+        return tip
     
     tip = {
         "tip_id": str(uuid.uuid4()),
@@ -87,8 +293,9 @@ def add_tip(recipient_agent: str, amount: int, comment_id: str, post_id: str = "
     }
     
     tracker["tips"].append(tip)
+    state.index(tip)
     tracker["stats"]["total_issued"] += 1
-    save_tracker(tracker)
+    _append_event({"op": "add", "tip": dict(tip), "stats": dict(tracker["stats"])})
     
     print(f"✅ Tip created: {tip['tip_id']}")
     print(f"   Recipient: {recipient_agent}")
@@ -104,29 +311,33 @@ def claim_tip(tip_id: str, claim_address: str) -> dict:
         print(f"❌ Invalid Solana address: {claim_address}")
         return None
     
-    tracker = load_tracker()
+    state = _load_state()
+    tracker = state.data
+    
+    tip = state.by_id.get(tip_id)
+    if tip is None:
+        print(f"❌ Tip not found: {tip_id}")
+        return None
+    
+    if tip["status"] != "pending":
+        print(f"⚠️  Tip already {tip['status']}")
+        return tip
+    
+    fields = {
+        "claim_address": claim_address,
+        "claimed_at": datetime.utcnow().isoformat(),
+        "status": "claimed",
+    }
+    tip.update(fields)
+    tracker["stats"]["total_claimed"] += 1
+    _append_event({"op": "claim", "tip_id": tip_id, "fields": fields, "stats": dict(tracker["stats"])})
+    
+    print(f"✅ Tip claimed: {tip_id}")
+    print(f"   Address: {claim_address}")
+    print(f"   Amount: {tip['amount']} WATT")
+    print(f"   Ready to send!")
     
-    for tip in tracker["tips"]:
-        if tip["tip_id"] == tip_id:
-            if tip["status"] != "pending":
-                print(f"⚠️  Tip already {tip['status']}")
-                return tip
-            
-            tip["claim_address"] = claim_address
-            tip["claimed_at"] = datetime.utcnow().isoformat()
-            tip["status"] = "claimed"
-            tracker["stats"]["total_claimed"] += 1
-            save_tracker(tracker)
-            
-            print(f"✅ Tip claimed: {tip_id}")
-            print(f"   Address: {claim_address}")
-            print(f"   Amount: {tip['amount']} WATT")
-            print(f"   Ready to send!")
-            
-            return tip
-    
-    print(f"❌ Tip not found: {tip_id}")
-    return None
+    return tip
 
 
 def list_tips(status_filter: str = None):
@@ -160,60 +371,79 @@ def list_tips(status_filter: str = None):
     print(f"  WATT distributed: {stats['total_watt_distributed']:,}")
 
 
-def generate_tip_message(agent: str, amount: int) -> str:
-    """Generate the tip announcement message."""
-    return f"""⚡ Quality insight — tipped {amount:,} WATT from the ecosystem pool.
+# Message templates, bound to str.format once at import
+_TIP_MESSAGE = """⚡ Quality insight — tipped {amount:,} WATT from the ecosystem pool.
 
 Reply with your Solana address to claim. No wallet? Create one at phantom.app in 60 seconds.
 
-WattCoin: Powering the agent economy."""
+WattCoin: Powering the agent economy.""".format
 
-
-def generate_confirmation_message(amount: int, address: str, tx_sig: str) -> str:
-    """Generate the claim confirmation message."""
-    short_addr = f"{address[:4]}...{address[-4:]}"
-    return f"""✅ {amount:,} WATT sent!
+_CONFIRMATION_MESSAGE = """✅ {amount:,} WATT sent!
 
 TX: https://solscan.io/tx/{tx_sig}
-Recipient: {short_addr}
+Recipient: {address_start}...{address_end}
 
-Welcome to the WattCoin ecosystem. ⚡"""
+Welcome to the WattCoin ecosystem. ⚡""".format
+
+
+def generate_tip_message(agent: str, amount: int) -> str:
+    """Generate the tip announcement message."""
+    return _TIP_MESSAGE(amount=amount)
+
+
+def generate_confirmation_message(amount: int, address: str, tx_sig: str) -> str:
+    """Generate the claim confirmation message."""
+    return _CONFIRMATION_MESSAGE(
+        amount=amount, tx_sig=tx_sig, address_start=address[:4], address_end=address[-4:]
+    )
 
 
 def mark_sent(tip_id: str, tx_signature: str):
     """Mark a tip as sent with transaction signature."""
-    tracker = load_tracker()
+    state = _load_state()
+    tracker = state.data
     
-    for tip in tracker["tips"]:
-        if tip["tip_id"] == tip_id:
-            tip["tx_signature"] = tx_signature
-            tip["sent_at"] = datetime.utcnow().isoformat()
-            tip["status"] = "sent"
-            tracker["stats"]["total_sent"] += 1
-            tracker["stats"]["total_watt_distributed"] += tip["amount"]
-            save_tracker(tracker)
-            
-            print(f"✅ Tip marked as sent: {tip_id}")
-            print(f"   TX: https://solscan.io/tx/{tx_signature}")
-            
-            # Generate confirmation message
-            print(f"\n📋 Confirmation message to post:")
-            print("-" * 40)
-            print(generate_confirmation_message(tip["amount"], tip["claim_address"], tx_signature))
-            print("-" * 40)
-            
-            return tip
+    tip = state.by_id.get(tip_id)
+    if tip is None:
+        print(f"❌ Tip not found: {tip_id}")
+        return None
     
-    print(f"❌ Tip not found: {tip_id}")
-    return None
+    fields = {
+        "tx_signature": tx_signature,
+        "sent_at": datetime.utcnow().isoformat(),
+        "status": "sent",
+    }
+    tip.update(fields)
+    tracker["stats"]["total_sent"] += 1
+    tracker["stats"]["total_watt_distributed"] += tip["amount"]
+    _append_event({"op": "sent", "tip_id": tip_id, "fields": fields, "stats": dict(tracker["stats"])})
+    
+    print(f"✅ Tip marked as sent: {tip_id}")
+    print(f"   TX: https://solscan.io/tx/{tx_signature}")
+    
+    # Generate confirmation message
+    print(f"\n📋 Confirmation message to post:")
+    print("-" * 40)
+    print(generate_confirmation_message(tip["amount"], tip["claim_address"], tx_signature))
+    print("-" * 40)
+    
+    return tip
 
 
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
         return
-    
-    cmd = sys.argv[1].lower()
+    try:
+        _run_command(sys.argv[1].lower())
+    finally:
+        # Each CLI run is its own process, so fold the journal back into the
+        # snapshot before exiting rather than leaving it for a later run
+        if _journal_file().exists():
+            save_tracker(_load_state().data)
+
+
+def _run_command(cmd: str):
     
     if cmd == "add":
         if len(sys.argv) < 5:
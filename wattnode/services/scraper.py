@@ -15,11 +15,37 @@ Error handling covers:
 
 import json
 import logging
-import random
+import itertools
+import re
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup tree builder
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# Elements whose text is never part of the page's visible content
+STRIP_TAGS = ["script", "style", "nav", "footer", "header"]
+
 # User agents for rotation
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
@@ -27,12 +53,30 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
 ]
 
+# Round-robin rotation; the lock keeps next() safe if jobs run in threads
+_UA_CYCLE = itertools.cycle(USER_AGENTS)
+_UA_LOCK = threading.Lock()
+
 TIMEOUT = 30
 MAX_SIZE = 2 * 1024 * 1024  # 2MB
+READ_CHUNK_SIZE = 64 * 1024
 MAX_REDIRECTS = 3
 
 logger = logging.getLogger("wattnode.scraper")
 
+# Shared session so repeat scrapes of the same origin reuse keep-alive
+# connections. Cookies are never stored, so one job can't leak state into the next.
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+# Fixed request headers live on the session; only the User-Agent varies per call
+_SESSION.headers.update({
+    "Accept": "text/html,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+})
+
 
 # ---------------------------------------------------------------------------
 # Custom exception hierarchy
@@ -167,20 +211,30 @@ def _validate_url(url: str) -> None:
     """Raise InvalidURLError if *url* is missing or has no http(s) scheme."""
     if not url or not url.strip():
         raise InvalidURLError("URL is required")
-    url = url.strip()
-    if not url.lower().startswith(("http://", "https://")):
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        raise InvalidURLError("URL is malformed")
+    if parts.scheme.lower() not in ("http", "https"):
         raise InvalidURLError("URL must start with http:// or https://")
+    if not parts.netloc:
+        raise InvalidURLError("URL is missing a host")
+
+
+# One pass over the error text; the named group that matched picks the exception
+_CONN_ERR_RE = re.compile(
+    r"(?P<dns>Name or service not known|Failed to resolve|Temporary failure in name resolution)"
+    r"|(?P<refused>Connection refused)"
+    r"|(?P<unreachable>Network is unreachable|No route to host)",
+    re.IGNORECASE,
+)
 
 
 def _map_connection_error(exc: requests.ConnectionError) -> ScraperException:
     """Translate a requests.ConnectionError into the most specific subclass."""
-    msg = str(exc)
-    if "Name or service not known" in msg or "Failed to resolve" in msg:
-        return DNSError()
-    if "Connection refused" in msg:
-        return ConnectionRefusedError_()
-    if "Network is unreachable" in msg:
-        return HostUnreachableError()
+    match = _CONN_ERR_RE.search(str(exc))
+    if match:
+        return _CONN_ERR_CLASSES[match.lastgroup]()
     # Generic fallback
     return ScraperException(
         "Failed to connect to the target server. Check the URL and try again.",
@@ -188,6 +242,66 @@ def _map_connection_error(exc: requests.ConnectionError) -> ScraperException:
     )
 
 
+_CONN_ERR_CLASSES = {
+    "dns": DNSError,
+    "refused": ConnectionRefusedError_,
+    "unreachable": HostUnreachableError,
+}
+
+
+# orjson turns integers outside 64 bits into floats instead of rejecting them
+_WIDE_NUMBER_RE = re.compile(rb"\d{19}")
+
+
+def _is_utf8(encoding: str) -> bool:
+    return encoding.lower().replace("_", "-") in ("utf-8", "utf8", "ascii", "us-ascii")
+
+
+def _parse_json(raw: bytearray, encoding: str):
+    """Parse a JSON body, handing UTF-8 bytes straight to orjson when available.
+
+    Other charsets, payloads orjson rejects (NaN, lone surrogates) and numbers
+    of 19+ digits, which orjson would round to floats past 64 bits, go through
+    the stdlib parser so results match json.loads.
+    """
+    if HAS_ORJSON and _is_utf8(encoding) and not _WIDE_NUMBER_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode(encoding, errors="replace"))
+
+
+def _extract_text(html: str) -> str:
+    """Return the visible text of *html*, using lexbor when selectolax is installed."""
+    if HAS_SELECTOLAX:
+        try:
+            tree = LexborHTMLParser(html)
+            tree.strip_tags(STRIP_TAGS)
+            if tree.root is None:
+                return ""
+            # Split on NUL (never left in parsed text) so whitespace-only
+            # nodes drop out instead of leaving double spaces, as in get_text()
+            parts = tree.root.text(separator="\x00", strip=True).split("\x00")
+            return " ".join(part for part in parts if part)
+        except Exception as exc:
+            logger.warning("lexbor parse failed, falling back to BeautifulSoup | error=%s", exc)
+    soup = BeautifulSoup(html, HTML_PARSER)
+    for element in soup(STRIP_TAGS):
+        element.decompose()
+    return soup.get_text(separator=" ", strip=True)
+
+
+def _next_user_agent() -> str:
+    with _UA_LOCK:
+        return next(_UA_CYCLE)
+
+
+def _http_get(url: str, **kwargs) -> requests.Response:
+    """GET *url* through the pooled session (the single seam tests patch)."""
+    return _SESSION.get(url, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -222,15 +336,11 @@ def local_scrape(url: str, format: str = "text") -> str:
     _validate_url(url)
     url = url.strip()
 
-    headers = {
-        "User-Agent": random.choice(USER_AGENTS),
-        "Accept": "text/html,application/json;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    headers = {"User-Agent": _next_user_agent()}
 
     # --- network fetch -----------------------------------------------------
     try:
-        resp = requests.get(
+        resp = _http_get(
             url,
             headers=headers,
             timeout=TIMEOUT,
@@ -239,13 +349,13 @@ def local_scrape(url: str, format: str = "text") -> str:
             verify=True,           # enforce SSL verification
         )
     except requests.exceptions.SSLError as exc:
-        logger.warning("ssl error | url=%.120s error=%s", url, str(exc)[:120])
+        logger.warning("ssl error | url=%.120s error=%.120s", url, exc)
         raise SSLError() from exc
     except requests.exceptions.Timeout as exc:
         logger.warning("timeout | url=%.120s", url)
         raise TimeoutError_() from exc
     except requests.exceptions.ConnectionError as exc:
-        logger.warning("connection error | url=%.120s error=%s", url, str(exc)[:120])
+        logger.warning("connection error | url=%.120s error=%.120s", url, exc)
         raise _map_connection_error(exc) from exc
     except requests.exceptions.RequestException as exc:
         logger.error("unexpected request error | url=%.120s type=%s", url, type(exc).__name__)
@@ -257,22 +367,39 @@ def local_scrape(url: str, format: str = "text") -> str:
     # --- HTTP status -------------------------------------------------------
     if resp.status_code < 200 or resp.status_code >= 300:
         logger.warning("http error | url=%.120s status=%d", url, resp.status_code)
+        resp.close()
         raise HTTPError(resp.status_code)
 
     # --- read body with size cap -------------------------------------------
+    # Refuse up front when the server declares an oversized body; the
+    # streaming check below still covers chunked / undeclared lengths
+    declared = resp.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > MAX_SIZE:
+        logger.warning("response too large | url=%.120s declared=%s", url, declared)
+        resp.close()
+        raise ResponseTooLargeError(int(declared))
+
     content = bytearray()
+    content_extend = content.extend  # bound once, outside the loop
+    remaining = MAX_SIZE
     try:
-        for chunk in resp.iter_content(chunk_size=8192):
+        for chunk in resp.iter_content(chunk_size=READ_CHUNK_SIZE):
             if chunk:
-                content.extend(chunk)
-                if len(content) > MAX_SIZE:
-                    logger.warning("response too large | url=%.120s size=%d", url, len(content))
-                    raise ResponseTooLargeError(len(content))
+                # Check against the remaining budget before copying, so an
+                # oversized chunk is never appended to the buffer
+                if len(chunk) > remaining:
+                    size = len(content) + len(chunk)
+                    logger.warning("response too large | url=%.120s size=%d", url, size)
+                    raise ResponseTooLargeError(size)
+                content_extend(chunk)
+                remaining -= len(chunk)
     except ResponseTooLargeError:
         raise  # re-raise our own error
     except Exception as exc:
         logger.error("read error | url=%.120s type=%s", url, type(exc).__name__)
         raise ParsingError("failed to read response body") from exc
+    finally:
+        resp.close()  # hand the connection back to the pool
 
     # --- empty check -------------------------------------------------------
     if len(content) == 0:
@@ -281,11 +408,12 @@ def local_scrape(url: str, format: str = "text") -> str:
 
     # --- decode ------------------------------------------------------------
     encoding = resp.encoding or "utf-8"
-    try:
-        text = bytes(content).decode(encoding, errors="replace")
-    except Exception as exc:
-        logger.error("decode error | url=%.120s encoding=%s", url, encoding)
-        raise ParsingError(f"failed to decode response with encoding '{encoding}'") from exc
+    if format != "json":
+        try:
+            text = content.decode(encoding, errors="replace")
+        except Exception as exc:
+            logger.error("decode error | url=%.120s encoding=%s", url, encoding)
+            raise ParsingError(f"failed to decode response with encoding '{encoding}'") from exc
 
     # --- format output -----------------------------------------------------
     try:
@@ -294,16 +422,13 @@ def local_scrape(url: str, format: str = "text") -> str:
 
         elif format == "json":
             try:
-                result = json.loads(text)
+                result = _parse_json(content, encoding)
             except json.JSONDecodeError as exc:
                 logger.warning("invalid json | url=%.120s", url)
                 raise InvalidJSONError() from exc
 
         else:  # text (default)
-            soup = BeautifulSoup(text, "html.parser")
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
-            result = soup.get_text(separator=" ", strip=True)
+            result = _extract_text(text)
     except (InvalidJSONError, EmptyResponseError):
         raise  # already the right type
     except Exception as exc: